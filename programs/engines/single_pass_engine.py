@@ -1,6 +1,7 @@
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 from llmgine.bus.bus import MessageBus
 from llmgine.llm import SessionID
@@ -28,11 +29,17 @@ class SinglePassEngine(Engine):
         model: Model,
         system_prompt: Optional[str] = None,
         session_id: Optional[SessionID] = None,
+        cache_size: int = 256,
     ):
         self.model = model
         self.system_prompt = system_prompt
         self.session_id = session_id
         self.bus = MessageBus()
+        # Every call is a standalone (system prompt, prompt) pair, so repeated prompts
+        # can be answered from an LRU cache instead of another LLM round trip.
+        # cache_size=0 disables the cache.
+        self.cache_size = cache_size
+        self._response_cache: OrderedDict[Tuple[str, str, str], str] = OrderedDict()
 
     async def handle_command(self, command: SinglePassEngineCommand) -> CommandResult:
         try:
@@ -42,6 +49,16 @@ class SinglePassEngine(Engine):
             return CommandResult(success=False, error=str(e))
 
     async def execute(self, prompt: str) -> str:
+        key = (
+            getattr(self.model, "model", type(self.model).__name__),
+            self.system_prompt or "",
+            prompt,
+        )
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            return cached
+
         if self.system_prompt:
             context = [
                 {"role": "system", "content": self.system_prompt},
@@ -57,6 +74,10 @@ class SinglePassEngine(Engine):
         await self.bus.publish(
             SinglePassEngineStatusEvent(status="finished", session_id=self.session_id)
         )
+        if self.cache_size > 0:
+            self._response_cache[key] = response.content
+            if len(self._response_cache) > self.cache_size:
+                self._response_cache.popitem(last=False)
         return response.content
 
 
@@ -96,6 +117,6 @@ async def main(case: int):
 
 
 if __name__ == "__main__":
-    import asyncio
+    from llmgine.bootstrap import run
 
-    asyncio.run(main(2))
+    run(main(2))
@@ -1,6 +1,8 @@
+import asyncio
+import logging
 import uuid
 import json
-import asyncio
+from functools import partial
 from typing import Any
 
 from llmgine.bus.bus import MessageBus
@@ -10,6 +12,7 @@ from llmgine.llm.providers.providers import Providers
 from llmgine.llm.tools.tool_manager import ToolManager
 from llmgine.llm.tools import ToolCall
 from llmgine.llm.models.openai_models import OpenAIResponse
+from openai.types.chat.chat_completion_message import ChatCompletionMessage
 
 from llmgine.messages.commands import Command, CommandResult
 from llmgine.messages.events import Event
@@ -19,6 +22,21 @@ from dataclasses import dataclass
 from llmgine.llm import SessionID, AsyncOrSyncToolFunction
 
 
+logger = logging.getLogger(__name__)
+
+# Consecutive rounds in which every tool call failed before the engine gives up,
+# instead of paying for more LLM calls that are likely to fail the same way
+MAX_FAILED_TOOL_ROUNDS = 2
+# Upper bound on LLM round trips per prompt, so a model that keeps calling
+# tools can't loop forever
+MAX_TOOL_ROUNDS = 8
+
+# Tool results that are sent back to the LLM as JSON, anything else goes through str()
+# (values json can't encode, like dates, fall back to str() inside the JSON)
+_to_json = partial(json.dumps, default=str)
+_STRINGIFIERS = {dict: _to_json, list: _to_json, tuple: _to_json}
+
+
 @dataclass
 class ToolChatEngineCommand(Command):
     """Command for the Tool Chat Engine."""
@@ -81,9 +99,10 @@ class ToolChatEngine:
         try:
             # 1. Add user message to history
             self.context_manager.store_string(command.prompt, "user")
+            failed_tool_rounds = 0
 
             # Loop for potential tool execution cycles
-            while True:
+            for _ in range(MAX_TOOL_ROUNDS):
                 # 2. Get current context (including latest user message or tool results)
                 current_context = await self.context_manager.retrieve()
 
@@ -99,30 +118,29 @@ class ToolChatEngine:
                         status="calling LLM", session_id=self.session_id
                     )
                 )
+                # Each turn resends the history, which OpenAI can only serve from its
+                # prefix cache if the request lands where the previous one was cached.
+                # The cache key keeps every turn of this session on the same cache.
                 response: OpenAIResponse = await self.llm_manager.generate(
-                    messages=current_context, tools=tools
-                )
-                assert isinstance(response, OpenAIResponse), (
-                    "response is not an OpenAIResponse"
+                    messages=current_context,
+                    tools=tools,
+                    extra_body={"prompt_cache_key": self.session_id},
                 )
  
                 # print(f"\nLLM Raw Response:\n{response.raw}\n")  # Debug print
 
                 # 5. Extract the first choice's message object
                 # Important: Access the underlying OpenAI object structure
-                response_message: dict = response.raw.choices[0].message
-                assert isinstance(response_message, dict), (
-                    "response_message is not a ChatCompletionMessage"
-                )
+                response_message: ChatCompletionMessage = response.raw.choices[0].message
 
                 # 6. Add the *entire* assistant message object to history.
                 # This is crucial for context if it contains tool_calls.
                 await self.context_manager.store_assistant_message(response_message)
 
                 # 7. Check for tool calls
-                if not response_message.get("tool_calls"):
+                if not response_message.tool_calls:
                     # No tool calls, break the loop and return the content
-                    final_content = response_message.get("content") or ""
+                    final_content = response_message.content or ""
 
                     # Notify status complete
                     await self.message_bus.publish(
@@ -134,66 +152,96 @@ class ToolChatEngine:
                         success=True, result=final_content, session_id=self.session_id
                     )
 
-                # 8. Process tool calls
-                for tool_call in response_message.get("tool_calls", []):
-                    tool_call_obj = ToolCall(
-                        id=tool_call.get("id"),
-                        name=tool_call.get("function", {}).get("name"),
-                        arguments=tool_call.get("function", {}).get("arguments"),
+                # 8. Process tool calls, concurrently since they are independent
+                tool_calls = [
+                    ToolCall(
+                        id=tool_call.id,
+                        name=tool_call.function.name,
+                        arguments=tool_call.function.arguments,
                     )
-                    try:
-                        # Execute the tool
-                        await self.message_bus.publish(
-                            ToolChatEngineStatusEvent(
-                                status="executing tool", session_id=self.session_id
-                            )
-                        )
-
-                        result = await self.tool_manager.execute_tool_call(tool_call_obj)
-
-                        # Convert result to string if needed for history
-                        if isinstance(result, dict):
-                            result_str = json.dumps(result)
-                        else:
-                            result_str = str(result)
-
-                        # Store tool execution result in history
-                        self.context_manager.store_tool_call_result(
-                            tool_call_id=tool_call_obj.id,
-                            name=tool_call_obj.name,
-                            content=result_str,
-                        )
+                    for tool_call in response_message.tool_calls
+                ]
+                await self.message_bus.publish(
+                    ToolChatEngineStatusEvent(
+                        status="executing tool", session_id=self.session_id
+                    )
+                )
+                results = await asyncio.gather(
+                    *(self._execute_tool_call(tool_call) for tool_call in tool_calls)
+                )
 
-                        # Publish tool execution event
-                        await self.message_bus.publish(
+                # Store results in call order so the history stays deterministic
+                result_events: list[Event] = []
+                for tool_call_obj, (succeeded, result_str) in zip(tool_calls, results):
+                    self.context_manager.store_tool_call_result(
+                        tool_call_id=tool_call_obj.id,
+                        name=tool_call_obj.name,
+                        content=result_str,
+                    )
+                    if succeeded:
+                        result_events.append(
                             ToolChatEngineToolResultEVent(
                                 tool_name=tool_call_obj.name,
                                 result=result_str,
                                 session_id=self.session_id,
                             )
                         )
-
-                    except Exception as e:
-                        error_msg = f"Error executing tool {tool_call_obj.name}: {str(e)}"
-                        print(error_msg)  # Debug print
-                        # Store error result in history
-                        self.context_manager.store_tool_call_result(
-                            tool_call_id=tool_call_obj.id,
-                            name=tool_call_obj.name,
-                            content=error_msg,
+                # Publish tool execution events as one batch
+                await self.message_bus.publish_many(result_events)
+
+                if result_events:
+                    failed_tool_rounds = 0
+                else:
+                    failed_tool_rounds += 1
+                    if failed_tool_rounds >= MAX_FAILED_TOOL_ROUNDS:
+                        await self.message_bus.publish(
+                            ToolChatEngineStatusEvent(
+                                status="finished", session_id=self.session_id
+                            )
+                        )
+                        return CommandResult(
+                            success=False,
+                            error="All tool calls failed repeatedly",
+                            session_id=self.session_id,
                         )
                 # After processing all tool calls, loop back to call the LLM again
                 # with the updated context (including tool results).
 
+            await self.message_bus.publish(
+                ToolChatEngineStatusEvent(status="finished", session_id=self.session_id)
+            )
+            return CommandResult(
+                success=False,
+                error="Max tool rounds exceeded",
+                session_id=self.session_id,
+            )
+
         except Exception as e:
-            # Log the exception before returning
-            # logger.exception(f"Error in handle_prompt_command for session {self.session_id}") # Requires logger setup
-            print(f"ERROR in handle_prompt_command: {e}")  # Simple print for now
-            import traceback
+            # Log the exception with its stack trace before returning
+            logger.exception(
+                f"Error in handle_prompt_command for session {self.session_id}"
+            )
+            return CommandResult(success=False, error=str(e), session_id=self.session_id)
 
-            traceback.print_exc()  # Print stack trace
+    async def _execute_tool_call(self, tool_call_obj: ToolCall) -> tuple[bool, str]:
+        """Execute a single tool call.
 
-            return CommandResult(success=False, error=str(e), session_id=self.session_id)
+        Args:
+            tool_call_obj: The tool call to execute
+
+        Returns:
+            Whether the tool succeeded, and its result or error message for history
+        """
+        try:
+            result = await self.tool_manager.execute_tool_call(tool_call_obj)
+            # Convert result to string if needed for history. Inside the try, a
+            # result that can't be encoded only fails this tool, not the round
+            stringify = _STRINGIFIERS.get(type(result), str)
+            return True, stringify(result)
+        except Exception as e:
+            error_msg = f"Error executing tool {tool_call_obj.name}: {str(e)}"
+            logger.warning(error_msg)
+            return False, error_msg
 
     async def register_tool(self, function: AsyncOrSyncToolFunction):
         """Register a function as a tool.
@@ -226,12 +274,14 @@ async def main():
     from llmgine.ui.cli.components import ToolComponent
     from llmgine.bootstrap import ApplicationBootstrap, ApplicationConfig
 
+    # Fails fast on a missing OPENAI_API_KEY, before starting the bus and log files
+    engine = ToolChatEngine(session_id=SessionID("test"))
+
     config = ApplicationConfig(enable_console_handler=False)
     bootstrap = ApplicationBootstrap(config)
     await bootstrap.bootstrap()
 
     cli = EngineCLI(SessionID("test"))
-    engine = ToolChatEngine(session_id=SessionID("test"))
     await engine.register_tool(get_weather)
     cli.register_engine(engine)
     cli.register_engine_command(ToolChatEngineCommand, engine.handle_command)
@@ -242,4 +292,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    from llmgine.bootstrap import run
+
+    run(main())
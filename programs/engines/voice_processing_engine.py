@@ -266,6 +266,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
+    from llmgine.bootstrap import run
 
-    asyncio.run(main())
+    run(main())
@@ -1,23 +1,50 @@
-import uuid
+from __future__ import annotations
+
 import asyncio
+import hashlib
+import logging
+import uuid
 import json
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, Any, List, Dict
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Any, List
 
 from llmgine.bus.bus import MessageBus
 from llmgine.llm import SessionID, AsyncOrSyncToolFunction
 from llmgine.llm.engine.engine import Engine
-from llmgine.llm.models.model import Model
-from llmgine.llm.providers.response import LLMResponse
 from llmgine.llm.tools.tool_manager import ToolManager
 from llmgine.llm.tools import ToolCall
-from llmgine.llm.models.openai_models import OpenAIResponse
-from openai.types.chat.chat_completion_message import ChatCompletionMessage
 from llmgine.llm.context.memory import SimpleChatHistory
 from llmgine.messages.commands import Command, CommandResult
 from llmgine.messages.events import Event
-from llmgine.ui.cli.cli import EngineCLI
-from llmgine.ui.cli.components import EngineResultComponent, ToolComponent
+
+if TYPE_CHECKING:
+    # Only used in annotations, importing the providers is slow
+    from openai.types.chat.chat_completion_message import ChatCompletionMessage
+    from llmgine.llm.models.openai_models import OpenAIResponse
+
+
+logger = logging.getLogger(__name__)
+
+# Consecutive rounds in which every tool call failed before execute gives up,
+# instead of paying for more LLM calls that are likely to fail the same way
+MAX_FAILED_TOOL_ROUNDS = 2
+# Upper bound on LLM round trips per prompt, so a model that keeps calling
+# tools can't loop forever
+MAX_TOOL_ROUNDS = 8
+
+# Prompts whose answer depends on when they are asked, never served from the cache
+_TIME_DEPENDENT = re.compile(
+    r"\b(now|today|tonight|tomorrow|yesterday|current(ly)?|latest|recent(ly)?)\b",
+    re.IGNORECASE,
+)
+
+# Tool results that are sent back to the LLM as JSON, anything else goes through str()
+# (values json can't encode, like dates, fall back to str() inside the JSON)
+_to_json = partial(json.dumps, default=str)
+_STRINGIFIERS = {dict: _to_json, list: _to_json, tuple: _to_json}
 
 
 @dataclass
@@ -45,6 +72,14 @@ class YourEngineToolResultEvent(Event):
     result: Any = None
 
 
+def _normalize_for_cache(message: dict[str, Any]) -> dict[str, Any]:
+    """Collapse whitespace in a user message for the response cache key."""
+    content = message.get("content")
+    if message.get("role") != "user" or not isinstance(content, str):
+        return message
+    return {**message, "content": " ".join(content.split())}
+
+
 class YourEngine(Engine):
     """A custom engine that can be extended with your own logic and tools."""
     
@@ -53,6 +88,7 @@ class YourEngine(Engine):
         model: Any,
         system_prompt: Optional[str] = None,
         session_id: Optional[SessionID] = None,
+        cache_size: int = 1024,
     ):
         """Initialize the custom engine.
         
@@ -60,6 +96,8 @@ class YourEngine(Engine):
             model: The LLM model to use
             system_prompt: Optional system prompt
             session_id: Optional session identifier
+            cache_size: Number of LLM responses kept in the exact-match cache,
+                0 disables it
         """
         self.model = model
         self.system_prompt = system_prompt
@@ -77,6 +115,14 @@ class YourEngine(Engine):
             engine_id=self.engine_id, 
             session_id=self.session_id
         )
+        if system_prompt:
+            # Sent first on every request, so keep it static for prompt caching
+            self.context_manager.set_system_prompt(system_prompt)
+
+        # An identical (model, messages, tools) request is answered from an LRU
+        # cache instead of another LLM round trip
+        self.cache_size = cache_size
+        self._response_cache: OrderedDict[str, ChatCompletionMessage] = OrderedDict()
 
     async def handle_command(self, command: Command) -> CommandResult:
         """Handle a command following the engine pattern.
@@ -88,9 +134,9 @@ class YourEngine(Engine):
             CommandResult: The result of the command execution
         """
         try:
-            my_command = command if isinstance(command, YourEngineCommand) else YourEngineCommand(**command.__dict__)
-            result = await self.execute(my_command.prompt)
-            return CommandResult(success=True, result=result, session_id=self.session_id)
+            # Other command types are accepted as long as they carry a prompt
+            prompt = getattr(command, "prompt", "")
+            return await self._run(prompt)
         except Exception as e:
             return CommandResult(success=False, error=str(e), session_id=self.session_id)
 
@@ -102,116 +148,203 @@ class YourEngine(Engine):
             
         Returns:
             The generated response
+            
+        Raises:
+            RuntimeError: If the engine gave up on the tool calls
+        """
+        result = await self._run(prompt)
+        if not result.success:
+            raise RuntimeError(result.error)
+        return result.result
+
+    async def _run(self, prompt: str) -> CommandResult:
+        """Answer a prompt, calling tools until the model stops asking for them.
+        
+        Giving up on tools (too many rounds, or every call failing repeatedly) is
+        an expected outcome and returned as a failed result, real errors raise.
+        
+        Args:
+            prompt: The user's prompt
+            
+        Returns:
+            CommandResult: The response, or why the engine gave up
         """
         try:
             self.context_manager.store_string(prompt, "user")
+            failed_tool_rounds = 0
+            use_cache = self.cache_size > 0 and not _TIME_DEPENDENT.search(prompt)
             
-            while True:
+            for _ in range(MAX_TOOL_ROUNDS):
                 context = await self.context_manager.retrieve()
                 
                 tools = await self.tool_manager.get_tools()
                 
-                await self.bus.publish(
-                    YourEngineStatusEvent(
-                        status="Processing request", 
-                        session_id=self.session_id
+                response_message = None
+                if use_cache:
+                    cache_key = self._cache_key(context, tools)
+                    response_message = self._response_cache.get(cache_key)
+                if response_message is not None:
+                    self._response_cache.move_to_end(cache_key)
+                else:
+                    await self.bus.publish(
+                        YourEngineStatusEvent(
+                            status="Processing request", 
+                            session_id=self.session_id
+                        )
                     )
-                )
 
-                response: OpenAIResponse = await self.model.generate(
-                    messages=context, 
-                    tools=tools
-                )
-                
-                response_message: ChatCompletionMessage = response.raw.choices[0].message
+                    response: OpenAIResponse = await self.model.generate(
+                        messages=context, 
+                        tools=tools
+                    )
+                    
+                    response_message = response.raw.choices[0].message
+                    if use_cache:
+                        self._response_cache[cache_key] = response_message
+                        if len(self._response_cache) > self.cache_size:
+                            self._response_cache.popitem(last=False)
                 
                 await self.context_manager.store_assistant_message(response_message)
                 
                 if not response_message.tool_calls:
                     final_content = response_message.content or ""
                     
-                    await self.bus.publish(
-                        YourEngineStatusEvent(
-                            status="Completed", 
-                            session_id=self.session_id
-                        )
-                    )
-                    
-                    await self.bus.publish(
+                    # "finished" is the status the CLI stops its spinner on
+                    await self.bus.publish_many([
                         YourEngineResultEvent(
                             result=final_content,
                             session_id=self.session_id
-                        )
-                    )
-                    await self.bus.publish(
-                        YourEngineStatusEvent(
-                            status="",
-                            session_id=self.session_id
-                        )
-                    )
-                    await self.bus.publish(
+                        ),
                         YourEngineStatusEvent(
                             status="finished",
                             session_id=self.session_id
-                        )
+                        ),
+                    ])
+                    return CommandResult(
+                        success=True, result=final_content, session_id=self.session_id
                     )
-                    return final_content
                 
-                for tool_call in response_message.tool_calls:
-                    tool_call_obj = ToolCall(
+                tool_calls = [
+                    ToolCall(
                         id=tool_call.id,
                         name=tool_call.function.name,
                         arguments=tool_call.function.arguments,
                     )
-                    
-                    try:
-                        await self.bus.publish(
-                            YourEngineStatusEvent(
-                                status="Executing tool", 
-                                session_id=self.session_id
-                            )
-                        )
-                        
-                        result = await self.tool_manager.execute_tool_call(tool_call_obj)
-                        
-                        if isinstance(result, dict):
-                            result_str = json.dumps(result)
-                        else:
-                            result_str = str(result)
-                        
-                        # Store tool result in conversation history
-                        self.context_manager.store_tool_call_result(
-                            tool_call_id=tool_call_obj.id,
-                            name=tool_call_obj.name,
-                            content=result_str
-                        )
-                        
-                        await self.bus.publish(
-                            YourEngineToolResultEvent(
-                                tool_name=tool_call_obj.name,
-                                result=result_str,
-                                session_id=self.session_id,
-                            )
-                        )
-                        
-                    except Exception as e:
-                        error_msg = f"Error executing tool {tool_call_obj.name}: {str(e)}"
-                        print(error_msg)
-                        
-                        # Store error result in conversation history
-                        self.context_manager.store_tool_call_result(
-                            tool_call_id=tool_call_obj.id,
-                            name=tool_call_obj.name,
-                            content=error_msg
-                        )
+                    for tool_call in response_message.tool_calls
+                ]
+                await self.bus.publish(
+                    YourEngineStatusEvent(
+                        status="Executing tool", 
+                        session_id=self.session_id
+                    )
+                )
+                # The calls don't depend on each other, run them concurrently
+                results = await asyncio.gather(
+                    *(self._execute_tool_call(tool_call) for tool_call in tool_calls)
+                )
                 
+                # Store results in call order so the history stays deterministic
+                for tool_call_obj, (_, result_str) in zip(tool_calls, results):
+                    # Store tool result in conversation history
+                    self.context_manager.store_tool_call_result(
+                        tool_call_id=tool_call_obj.id,
+                        name=tool_call_obj.name,
+                        content=result_str
+                    )
+                
+                if any(succeeded for succeeded, _ in results):
+                    failed_tool_rounds = 0
+                else:
+                    failed_tool_rounds += 1
+                    if failed_tool_rounds >= MAX_FAILED_TOOL_ROUNDS:
+                        return await self._give_up("All tool calls failed repeatedly")
+            
+            return await self._give_up("Max tool rounds exceeded")
                 
         except Exception as e:
-            print(f"ERROR in execute: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Error in execute for session {self.session_id}")
+            # Stop the CLI spinner on the error path too
+            await self.bus.publish(
+                YourEngineStatusEvent(
+                    status="finished",
+                    session_id=self.session_id
+                )
+            )
             raise e
 
+    async def _give_up(self, error: str) -> CommandResult:
+        """Stop the CLI spinner and report why the engine stopped calling tools.
+        
+        Args:
+            error: Why the engine gave up
+            
+        Returns:
+            CommandResult: The failed result
+        """
+        await self.bus.publish(
+            YourEngineStatusEvent(
+                status="finished",
+                session_id=self.session_id
+            )
+        )
+        return CommandResult(success=False, error=error, session_id=self.session_id)
+
+    def _cache_key(self, context: List[dict[str, Any]], tools: Any) -> str:
+        """Hash of everything that determines the LLM response.
+        
+        User messages are compared with whitespace collapsed, so prompts that only
+        differ in spacing (" calc  2+2" / "calc 2+2") share an entry. Case is kept,
+        "spell CAT" and "spell cat" can need different answers.
+        
+        Args:
+            context: The messages sent to the model
+            tools: The tool schemas sent to the model
+            
+        Returns:
+            The response cache key
+        """
+        payload = json.dumps(
+            {
+                "model": getattr(self.model, "model", type(self.model).__name__),
+                "messages": [_normalize_for_cache(message) for message in context],
+                "tools": tools,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def _execute_tool_call(self, tool_call_obj: ToolCall) -> tuple[bool, str]:
+        """Execute a single tool call.
+        
+        The result event is published as soon as this tool finishes, so the CLI
+        shows fast tools without waiting for the slowest call of the round.
+        
+        Args:
+            tool_call_obj: The tool call to execute
+            
+        Returns:
+            Whether the tool succeeded, and its result or error message for history
+        """
+        try:
+            result = await self.tool_manager.execute_tool_call(tool_call_obj)
+            # A result that can't be encoded only fails this tool, not the round
+            stringify = _STRINGIFIERS.get(type(result), str)
+            result_str = stringify(result)
+        except Exception as e:
+            error_msg = f"Error executing tool {tool_call_obj.name}: {str(e)}"
+            logger.warning(error_msg)
+            return False, error_msg
+        
+        await self.bus.publish(
+            YourEngineToolResultEvent(
+                tool_name=tool_call_obj.name,
+                result=result_str,
+                session_id=self.session_id,
+            )
+        )
+        return True, result_str
+
     async def register_tool(self, function: AsyncOrSyncToolFunction):
         """Register a function as a tool.
         
@@ -221,6 +354,16 @@ class YourEngine(Engine):
         await self.tool_manager.register_tool(function)
         print(f"Tool registered: {function.__name__}")
 
+    async def register_tools(self, functions: List[AsyncOrSyncToolFunction]):
+        """Register several functions as tools at once.
+        
+        Args:
+            functions: The functions to register as tools
+        """
+        await self.tool_manager.register_tool_functions(functions)
+        for function in functions:
+            print(f"Tool registered: {function.__name__}")
+
     async def clear_context(self):
         """Clear the conversation context."""
         self.context_manager.clear()
@@ -264,10 +407,15 @@ async def main(case: int = 1):
     from llmgine.bootstrap import ApplicationBootstrap, ApplicationConfig
     from llmgine.llm.models.openai_models import Gpt41Mini
     from llmgine.llm.providers.providers import Providers
+    from llmgine.ui.cli.cli import EngineCLI
+    from llmgine.ui.cli.components import EngineResultComponent, ToolComponent
     
     # Import Project 1 tools
     from tools.project1_tools import Calculator, WebSearch, SlotMachine
 
+    # Fails fast on a missing OPENAI_API_KEY, before starting the bus and log files
+    model = Gpt41Mini(Providers.OPENAI)
+
     config = ApplicationConfig(enable_console_handler=False)
     bootstrap = ApplicationBootstrap(config)
     await bootstrap.bootstrap()
@@ -276,7 +424,7 @@ async def main(case: int = 1):
         print("Starting My Custom Engine with Project 1 Tools in CLI mode...")
         
         engine = YourEngine(
-            model=Gpt41Mini(Providers.OPENAI),
+            model=model,
             system_prompt="You are a helpful AI assistant with access to powerful tools. You can calculate math expressions, search the web, and even play a slot machine game! Always be encouraging and provide detailed, helpful responses.",
             session_id=SessionID("my-custom-engine")
         )
@@ -309,8 +457,7 @@ async def main(case: int = 1):
             """
             return await slot_machine.execute(action, bet_amount)
         
-        await engine.register_tool(calculate_math)
-        await engine.register_tool(play_slot_machine)
+        await engine.register_tools([calculate_math, play_slot_machine])
         
         cli = EngineCLI(SessionID("my-custom-engine"))
         cli.register_engine(engine)
@@ -326,7 +473,7 @@ async def main(case: int = 1):
         
         result = await use_my_custom_engine(
             prompt="Hello! Can you calculate 15 * 23 for me?",
-            model=Gpt41Mini(Providers.OPENAI),
+            model=model,
             system_prompt="You are a helpful assistant with access to a calculator tool. Use it when users ask for calculations."
         )
         
@@ -334,4 +481,6 @@ async def main(case: int = 1):
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    from llmgine.bootstrap import run
+
+    run(main())
\ No newline at end of file
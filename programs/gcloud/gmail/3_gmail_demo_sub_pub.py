@@ -4,6 +4,7 @@ import json
 # AI: Add 'import base64' back if you uncomment the email body decoding logic.
 # import base64 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Callable
 
 # AI: Google Cloud & API client libraries
@@ -12,6 +13,7 @@ from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build, Resource
 from google.cloud import pubsub_v1
+from google.cloud.pubsub_v1.subscriber.scheduler import ThreadScheduler
 
 # AI: Define types for better readability
 type ProjectId = str
@@ -35,6 +37,10 @@ PUB_SUB_SUBSCRIPTION_NAME: SubscriptionName = "gmail-subscriber"  # e.g., "gmail
 TARGET_EMAIL_IDS: List[EmailAddress] = [
     "ai@dscubed.org.au",
 ]
+# AI: Lower-cased once at import, process_email checks every incoming sender against it
+NORMALIZED_TARGET_EMAIL_IDS: frozenset[EmailAddress] = frozenset(
+    target.lower() for target in TARGET_EMAIL_IDS
+)
 
 FOLDER: str = "gcloud/gmail"
 
@@ -54,6 +60,12 @@ SCOPES: List[str] = [
 # AI: Label to apply for the watch request (optional, but good practice)
 WATCH_LABEL_IDS: List[str] = ["INBOX"] # AI: Only watch INBOX, or specify others e.g., ["IMPORTANT"]
 
+# AI: Subscriber concurrency. Each callback does blocking Gmail API calls, so a burst of
+# AI: notifications is handled by a pool of worker threads instead of the default scheduler.
+SUBSCRIBER_MAX_WORKERS: int = 16
+SUBSCRIBER_MAX_MESSAGES: int = 500 # AI: Max outstanding (unacked) messages held by the client
+SUBSCRIBER_MAX_BYTES: int = 100 * 1024 * 1024 # AI: Max outstanding message bytes (100 MiB)
+
 # AI: --- Gmail API Authentication & Service ---
 
 def get_gmail_service() -> Optional[Resource]:
@@ -198,9 +210,8 @@ def process_email(message_id: str, service: Resource) -> None:
             print(f"AI: Received email from: {sender_email}, Subject: \'{subject}\'")
             # AI: Convert to lower for case-insensitive comparison
             normalized_sender_email = sender_email.lower()
-            normalized_target_emails = [target.lower() for target in TARGET_EMAIL_IDS]
 
-            if normalized_sender_email in normalized_target_emails:
+            if normalized_sender_email in NORMALIZED_TARGET_EMAIL_IDS:
                 print(f"AI: ---> Email from \'{sender_email}\' matches a target email ID. Executing custom code...")
                 # AI: !!! YOUR CUSTOM CODE GOES HERE !!!
                 # AI: You have access to the full \'msg\' object here, which is the GmailMessage dictionary.
@@ -308,7 +319,18 @@ def listen_for_messages(project_id: ProjectId, subscription_name: SubscriptionNa
 
     # AI: The subscriber client is non-blocking, so we need to keep the main thread alive.
     # AI: `streaming_pull_future` is a future that will block until the stream is broken.
-    streaming_pull_future: Any = subscriber.subscribe(subscription_path, callback=callback)
+    # AI: Size flow control and the callback thread pool for the actual concurrency we want
+    flow_control = pubsub_v1.types.FlowControl(
+        max_messages=SUBSCRIBER_MAX_MESSAGES,
+        max_bytes=SUBSCRIBER_MAX_BYTES,
+    )
+    scheduler = ThreadScheduler(executor=ThreadPoolExecutor(max_workers=SUBSCRIBER_MAX_WORKERS))
+    streaming_pull_future: Any = subscriber.subscribe(
+        subscription_path,
+        callback=callback,
+        flow_control=flow_control,
+        scheduler=scheduler,
+    )
 
     try:
         # AI: Keep the main thread alive, waiting for messages indefinitely.
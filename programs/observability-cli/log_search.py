@@ -16,6 +16,8 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
+from llmgine.observability.handlers.file import split_log_records
+
 # Default logs directory
 DEFAULT_LOGS_DIR = Path(os.path.expanduser("~/dev/llmgine/logs"))
 
@@ -58,15 +60,7 @@ class LogSearcher:
         with open(self.log_file, "r") as f:
             content = f.read()
             
-        # Split by closing brace followed by an opening brace (with possible whitespace)
-        # This is to handle both single-line and multi-line JSON objects
-        json_objects = []
-        current_obj = ""
-        for line in content.split("\n"):
-            current_obj += line
-            if line.strip() == "}":
-                json_objects.append(current_obj)
-                current_obj = ""
+        json_objects = split_log_records(content)
         
         # Parse each JSON object
         for json_str in json_objects:
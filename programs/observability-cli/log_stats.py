@@ -14,6 +14,8 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from llmgine.observability.handlers.file import split_log_records
+
 
 class LogStats:
     """Generate statistics from LLMgine event logs."""
@@ -44,15 +46,7 @@ class LogStats:
         with open(self.log_file, "r") as f:
             content = f.read()
             
-        # Split by closing brace followed by an opening brace (with possible whitespace)
-        # This is to handle both single-line and multi-line JSON objects
-        json_objects = []
-        current_obj = ""
-        for line in content.split("\n"):
-            current_obj += line
-            if line.strip() == "}":
-                json_objects.append(current_obj)
-                current_obj = ""
+        json_objects = split_log_records(content)
         
         # Parse each JSON object
         for json_str in json_objects:
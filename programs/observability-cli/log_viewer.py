@@ -17,6 +17,8 @@ from rich.text import Text
 from rich.syntax import Syntax
 from rich.tree import Tree
 
+from llmgine.observability.handlers.file import split_log_records
+
 # Default logs directory
 DEFAULT_LOGS_DIR = Path(os.path.expanduser("~/dev/llmgine/logs"))
 
@@ -68,15 +70,7 @@ class EventLogViewer:
         with open(self.log_file, "r") as f:
             content = f.read()
             
-        # Split by closing brace followed by an opening brace (with possible whitespace)
-        # This is to handle both single-line and multi-line JSON objects
-        json_objects = []
-        current_obj = ""
-        for line in content.split("\n"):
-            current_obj += line
-            if line.strip() == "}":
-                json_objects.append(current_obj)
-                current_obj = ""
+        json_objects = split_log_records(content)
         
         # Parse each JSON object
         for json_str in json_objects:
@@ -1,13 +1,19 @@
 import datetime
 import os
+import shutil
 import dotenv
 import requests
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Set, Tuple
 from collections import defaultdict as dd
 
 dotenv.load_dotenv()
 
+# Read once at import, the key does not change for the lifetime of the process
+ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
+ELEVENLABS_HEADERS: Dict[str, str] = {"xi-api-key": ELEVENLABS_API_KEY or ""}
+
 filler_words = {
     '', 
     'huh', 
@@ -62,7 +68,6 @@ def transcribe(
     audio_file: str,
     num_speakers: int
 ) -> Dict[str, Any]:
-    ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
     if not ELEVENLABS_API_KEY:
         raise ValueError("ELEVENLABS_API_KEY not found in environment variables")
         
@@ -82,9 +87,7 @@ def transcribe(
         res = post(
             url='https://api.elevenlabs.io/v1/speech-to-text',
             data=data,
-            headers={
-                "xi-api-key": ELEVENLABS_API_KEY
-            },
+            headers=ELEVENLABS_HEADERS,
             files=files
         )
     
@@ -98,7 +101,8 @@ def process_transcription(result: Dict[str, Any]) -> List[Dict[str, Any]]:
     conversation : List[Dict[str, Any]] = []
 
     current_speaker = None
-    current_sentence = ""
+    # Buffer the words of the current speaker and join them once on speaker change
+    current_parts : List[str] = []
     for word_dict in result_words:
         word = word_dict["text"]
         speaker = word_dict["speaker_id"]
@@ -107,19 +111,19 @@ def process_transcription(result: Dict[str, Any]) -> List[Dict[str, Any]]:
             if current_speaker is not None:
                 conversation.append({
                     "speaker": current_speaker,
-                    "sentence": current_sentence
+                    "sentence": "".join(current_parts)
                 })
 
             current_speaker = speaker
-            current_sentence = word
+            current_parts = [word]
         else:
-            current_sentence += word
+            current_parts.append(word)
 
     # Add the last sentence to the conversation
     if current_speaker is not None:
         conversation.append({
             "speaker": current_speaker,
-            "sentence": current_sentence
+            "sentence": "".join(current_parts)
         })
 
     return conversation
@@ -130,17 +134,26 @@ def find_filler_words(file_path: str) -> Set[str]:
     
     filler_words : Set[str] = set()
     for sentence in conversation:
-        words = sentence["sentence"].split(" ")
+        # split() with no separator skips the empty tokens left by repeated spaces
+        words = sentence["sentence"].split()
         if len(words) <= 2:
             filler_words.update(words)
 
     return filler_words
 
+def _is_all_filler(sentence: str) -> bool:
+    """
+    Check whether every word of the sentence is a filler word.
+    Bails out on the first real word, which is usually one of the first few.
+    """
+    for word in sentence.split():
+        if word.lower().strip('.,!?:;-') not in filler_words:
+            return False
+    return True
+
 def cleanup_conversation(conversation: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    for sentence in conversation:
-        current_sentence = sentence["sentence"]
-        if all(word.lower().strip('.,!?:;-') in filler_words for word in current_sentence.split(" ")):
-            conversation.remove(sentence)
+    # Filter in a single pass, removing while iterating skips the sentence after each removal
+    conversation[:] = [sentence for sentence in conversation if not _is_all_filler(sentence["sentence"])]
 
     i,j = 0,0
     while i <= len(conversation) - 1:
@@ -177,6 +190,17 @@ def build_file_name(num : int, audio_file: str, step: str, time : bool = True) -
     else:
         return "/" + str(num) + "_" + audio_file.split('.')[0] + "_" + step + ".json"
 
+def write_text(file_path: str, text: str) -> None:
+    with open(file_path, "w") as f:
+        f.write(text)
+
+def write_json_in_background(writer: ThreadPoolExecutor, file_path: str, data: Any) -> Future[None]:
+    """
+    Encode the data now and hand the file write to the writer pool.
+    Encoding happens on the calling thread so later in-place changes to data are not picked up.
+    """
+    return writer.submit(write_text, file_path, json.dumps(data, indent=2))
+
 def process_audio(audio_file: str, num_speakers: str) -> Tuple[Dict[str, List[str]], str]:
     """
     Process the audio file and return the conversation.
@@ -211,41 +235,53 @@ def process_audio(audio_file: str, num_speakers: str) -> Tuple[Dict[str, List[st
     # ----------------------------------------
     # 2. Get the transcription and write it to a file
     # ----------------------------------------
-    # Check if the transcription file exists
-    if os.path.exists(transcribed_file_dir + '/' + audio_file.split('.')[0] + "_raw_transcript.json"):
-        with open(transcribed_file_dir + '/' + audio_file.split('.')[0] + "_raw_transcript.json", "r") as f:
+    # Reuse a cached transcription if there is one, otherwise transcribe and cache it
+    # so later runs on the same audio skip the ElevenLabs round trip
+    raw_transcript_path = transcribed_file_dir + '/' + audio_file.split('.')[0] + "_raw_transcript.json"
+    result : Dict[str, Any]
+    if os.path.exists(raw_transcript_path):
+        with open(raw_transcript_path, "r") as f:
             result = json.load(f)
     else:
-        return {}, "Transcription file not found"
-        result : Dict[str, Any] = transcribe(audio_file_path, num_speakers_int)
-
-    with open(new_dir + build_file_name(1, audio_file, "raw_transcript"), "w") as f:
-        json.dump(result, f, indent=2)
-
-    # ----------------------------------------
-    # 3. Process the transcription into a conversational format
-    # ----------------------------------------
-    conversation : List[Dict[str, Any]] = process_transcription(result)
-
-    with open(new_dir + build_file_name(2, audio_file, "raw_conversation"), "w") as f:
-        json.dump(conversation, f, indent=2)
-
-    # ----------------------------------------
-    # 4. Cleanup the conversation (remove filler words, merge sentences from the same speaker)
-    # ----------------------------------------
-    cleaned_conversation = cleanup_conversation(conversation)
-
-    # To be returned later
-    audio_file_path = new_dir + build_file_name(3, audio_file, "parsed_conversation")
-    with open(audio_file_path, "w") as f:
-        json.dump(cleaned_conversation, f, indent=2)
-
-    # ----------------------------------------
-    # 5. Get a snippet of the conversation for each speaker
-    # ----------------------------------------
-    snippet = get_conversation_snippet(cleaned_conversation)
-    with open(new_dir + build_file_name(4, audio_file, "speaker_snippet"), "w") as f:
-        json.dump(snippet, f, indent=2)
+        result = transcribe(audio_file_path, num_speakers_int)
+        # Same indent=2 as the other outputs, the step-1 file is a copy of this one
+        with open(raw_transcript_path, "w") as f:
+            json.dump(result, f, indent=2)
+
+    # Intermediate files are not read back by the pipeline, so they are written on a
+    # background thread while the next step runs. Leaving the with block waits for them.
+    with ThreadPoolExecutor(max_workers=2) as writer:
+        writes : List[Future[Any]] = []
+
+        # The raw transcript is already on disk, copy it as-is instead of re-encoding it
+        writes.append(writer.submit(shutil.copyfile, raw_transcript_path, new_dir + build_file_name(1, audio_file, "raw_transcript")))
+
+        # ----------------------------------------
+        # 3. Process the transcription into a conversational format
+        # ----------------------------------------
+        conversation : List[Dict[str, Any]] = process_transcription(result)
+
+        # Encode before the next step, cleanup_conversation mutates the list in place
+        writes.append(write_json_in_background(writer, new_dir + build_file_name(2, audio_file, "raw_conversation"), conversation))
+
+        # ----------------------------------------
+        # 4. Cleanup the conversation (remove filler words, merge sentences from the same speaker)
+        # ----------------------------------------
+        cleaned_conversation = cleanup_conversation(conversation)
+
+        # To be returned later
+        audio_file_path = new_dir + build_file_name(3, audio_file, "parsed_conversation")
+        writes.append(write_json_in_background(writer, audio_file_path, cleaned_conversation))
+
+        # ----------------------------------------
+        # 5. Get a snippet of the conversation for each speaker
+        # ----------------------------------------
+        snippet = get_conversation_snippet(cleaned_conversation)
+        writes.append(write_json_in_background(writer, new_dir + build_file_name(4, audio_file, "speaker_snippet"), snippet))
+
+    # Surface any error raised while writing
+    for write in writes:
+        write.result()
     
     return snippet, audio_file_path
 
@@ -4,9 +4,10 @@ Provides a way to bootstrap the application components including
 the observability bus and the message bus.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Callable, Generic, Optional, Type, TypeVar
+from typing import Any, Callable, Coroutine, Generic, Optional, Type, TypeVar
 
 from llmgine.bus.bus import MessageBus
 from llmgine.bus.session import BusSession
@@ -22,6 +23,7 @@ logger = logging.getLogger(__name__)
 
 # Type definitions
 TConfig = TypeVar("TConfig")
+TResult = TypeVar("TResult")
 
 
 # --- Basic Logging Setup Function ---
@@ -46,6 +48,23 @@ def setup_basic_logging(level: LogLevel = LogLevel.INFO):
     logger.info(f"Basic logging configured with level {logging_level}")
 
 
+def run(main: Coroutine[Any, Any, TResult]) -> TResult:
+    """Run an application entry point to completion.
+
+    Uses the uvloop event loop when it is installed, which is a drop-in faster
+    replacement for the default asyncio loop. Falls back to asyncio.run otherwise
+    (uvloop is not available on Windows).
+
+    Args:
+        main: The top level coroutine of the application
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
 @dataclass
 class ApplicationConfig:
     """Base configuration for applications."""
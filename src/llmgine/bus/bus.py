@@ -97,6 +97,8 @@ class MessageBus:
         ] = {}
         self._event_queue: Optional[asyncio.Queue[Event]] = None
         self._processing_task: Optional[asyncio.Task[None]] = None
+        # Set when events are queued that no publisher is draining itself
+        self._events_queued: Optional[asyncio.Event] = None
         self._observability_handlers: List[ObservabilityEventHandler] = []
         self._suppress_event_errors: bool = True
         self.event_handler_errors: List[Exception] = []
@@ -149,6 +151,7 @@ class MessageBus:
                 self._event_queue = asyncio.Queue()
                 logger.info("Event queue created")
             await self._load_queue()
+            self._events_queued = asyncio.Event()
             self._processing_task = asyncio.create_task(self._process_events())
             logger.info("MessageBus started")
         else:
@@ -231,7 +234,8 @@ class MessageBus:
         Args:
             session_id: The session identifier (or 'ROOT').
             event_type: The type of event to handle.
-            handler: The handler function/coroutine.
+            handler: The handler function/coroutine. Registering a handler that is
+                already registered for the event type and session is a no-op.
         """
 
         if session_id not in self._event_handlers:
@@ -240,6 +244,15 @@ class MessageBus:
         if event_type not in self._event_handlers[SessionID(session_id)]:
             self._event_handlers[SessionID(session_id)][event_type] = []
 
+        # Registering the same handler again (e.g. a restarted CLI) would make every
+        # publish call it once per registration, so keep a single registration
+        for registered in self._event_handlers[SessionID(session_id)][event_type]:
+            if getattr(registered, "function", registered) == handler:
+                logger.debug(
+                    f"Event handler for {event_type} already registered in session {session_id}"
+                )
+                return
+
         if not is_async_function(handler):
             handler = self._wrap_event_handler_as_async(cast(EventHandler, handler))
 
@@ -391,6 +404,42 @@ class MessageBus:
         finally:
             if not isinstance(event, ScheduledEvent) and await_processing:
                 await self.ensure_events_processed()
+            else:
+                self._notify_queued()
+
+    async def publish_many(
+        self, events: List[Event], await_processing: bool = True
+    ) -> None:
+        """
+        Publish several events onto the event queue, in order.
+        The queue is drained once for the whole batch instead of once per event.
+        Args:
+            events: The event instances to publish.
+        """
+        if not events:
+            return
+
+        logger.info(f"Publishing {len(events)} events")
+
+        try:
+            if self._event_queue is None:
+                raise ValueError("Event queue is not initialized")
+            for event in events:
+                self._event_queue.put_nowait(event)
+        except Exception as e:
+            logger.error(f"Error queing events: {e}", exc_info=True)
+        finally:
+            if await_processing:
+                await self.ensure_events_processed()
+            else:
+                self._notify_queued()
+
+    def _notify_queued(self) -> None:
+        """
+        Wake the processing loop for events that were queued without being awaited.
+        """
+        if self._events_queued is not None:
+            self._events_queued.set()
 
     async def _process_events(self) -> None:
         """
@@ -427,8 +476,13 @@ class MessageBus:
                         logger.info("Event processing loop cancelled")
                         raise
                 
-                # Leave time for other processes to run
-                await asyncio.sleep(1)
+                # Wait until events are published without being awaited, and
+                # still wake up every second to recheck scheduled events
+                try:
+                    await asyncio.wait_for(self._events_queued.wait(), timeout=1)  # type: ignore
+                except asyncio.TimeoutError:
+                    pass
+                self._events_queued.clear()  # type: ignore
 
             except asyncio.CancelledError:
                 logger.info("Event processing loop cancelled")
@@ -517,12 +571,43 @@ class MessageBus:
         logger.debug(
             f"Dispatching event {event_type} in session {event.session_id} to {len(handlers)} handlers"  # type: ignore
         )
-        tasks = [asyncio.create_task(handler(event)) for handler in handlers]  # type: ignore
-        results = await asyncio.gather(*tasks, return_exceptions=True)  # type: ignore
-        for i, result in enumerate(results):  # type: ignore
+        # Sync handlers (wrapped at registration) are called inline, they cannot
+        # overlap with anything anyway. From the first real coroutine on, handlers
+        # are started together in registration order, so a sync handler never runs
+        # before an async one registered earlier. A lone coroutine is awaited
+        # directly without scheduling a task.
+        dispatched: List[Any] = []
+        results: List[Any] = []
+        pending: List[AsyncEventHandler] = []
+        for handler in handlers:  # type: ignore
+            function = getattr(handler, "function", None)
+            if function is None or pending:
+                pending.append(handler)  # type: ignore
+                continue
+            try:
+                results.append(function(event))
+            except Exception as e:
+                results.append(e)
+            dispatched.append(function)
+
+        if len(pending) == 1:
+            try:
+                results.append(await pending[0](event))
+            except Exception as e:
+                results.append(e)
+        elif pending:
+            results.extend(
+                await asyncio.gather(
+                    *(handler(event) for handler in pending),
+                    return_exceptions=True,
+                )
+            )
+        dispatched.extend(getattr(handler, "function", handler) for handler in pending)
+
+        for i, result in enumerate(results):
             if isinstance(result, Exception):
                 self.event_handler_errors.append(result)
-                handler_name = getattr(handlers[i], "__qualname__", repr(handlers[i]))  # type: ignore
+                handler_name = getattr(dispatched[i], "__qualname__", repr(dispatched[i]))
                 logger.exception(
                     f"Error in handler '{handler_name}' for {event_type}: {result}"
                 )
@@ -77,7 +77,6 @@ class DummyEngine(Engine):
         await self.bus.publish(
             DummyEngineStatusUpdate(status="finished", session_id=self.session_id)
         )
-        await self.bus.ensure_events_processed()
         return CommandResult(success=True, result=result)
 
     def execute(self, prompt: str):
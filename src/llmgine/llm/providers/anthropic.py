@@ -30,16 +30,22 @@ class AnthropicResponse(LLMResponse):
 
     @property
     def tool_calls(self) -> List[ToolCall]:
-        if not self.response.choices[0].message.tool_calls:
+        tool_calls = self.response.choices[0].message.tool_calls
+        if not tool_calls:
             return []
         return [
-            ToolCall(tool_call.id, tool_call.function.name, tool_call.function.arguments)
-            for tool_call in self.response.choices[0].message.tool_calls
+            ToolCall(
+                id=tool_call.id,
+                name=tool_call.function.name,
+                arguments=tool_call.function.arguments,
+            )
+            for tool_call in tool_calls
         ]
 
     @property
     def has_tool_calls(self) -> bool:
-        return len(self.tool_calls) > 0
+        # Don't build the ToolCall list just to count it
+        return bool(self.response.choices[0].message.tool_calls)
 
     @property
     def finish_reason(self) -> str:
@@ -90,7 +96,15 @@ class AnthropicProvider(LLMProvider):
 
         # System prompt extract
         if messages[0]["role"] == "system":
-            payload["system"] = messages[0]["content"]
+            # Cache breakpoint after the system prompt, so the tools and system
+            # prompt prefix is reused across calls instead of processed each time
+            payload["system"] = [
+                {
+                    "type": "text",
+                    "text": messages[0]["content"],
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
             payload["messages"] = messages[1:]
 
         if temperature:
@@ -29,16 +29,22 @@ class OpenAIResponse(LLMResponse):
 
     @property
     def tool_calls(self) -> List[ToolCall]:
-        if not self.response.choices[0].message.tool_calls:
+        tool_calls = self.response.choices[0].message.tool_calls
+        if not tool_calls:
             return []
         return [
-            ToolCall(tool_call.id, tool_call.function.name, tool_call.function.arguments)
-            for tool_call in self.response.choices[0].message.tool_calls
+            ToolCall(
+                id=tool_call.id,
+                name=tool_call.function.name,
+                arguments=tool_call.function.arguments,
+            )
+            for tool_call in tool_calls
         ]
 
     @property
     def has_tool_calls(self) -> bool:
-        return len(self.tool_calls) > 0
+        # Don't build the ToolCall list just to count it
+        return bool(self.response.choices[0].message.tool_calls)
 
     @property
     def finish_reason(self) -> str:
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Represents a tool call from an LLM."""
 
@@ -25,6 +25,7 @@ from llmgine.llm.tools.tool_parser import (
 from llmgine.llm.tools.tool_register import ToolRegister
 from llmgine.llm.tools.toolCall import ToolCall
 from llmgine.llm import SessionID
+from llmgine.messages.events import Event
 
 class ToolManager:
     """Manages tool registration and execution."""
@@ -38,6 +39,8 @@ class ToolManager:
         self.session_id: SessionID = session_id
         self.message_bus: MessageBus = MessageBus()
         self.tools: dict[str, Tool] = {}
+        # Tools in the model's format, compiled on the first get_tools after a change
+        self._compiled_tools: Optional[list[ModelFormattedDictTool]] = None
         self.__tool_parser: ToolParser = self._get_parser(llm_model_name)
         self.__tool_register: ToolRegister = ToolRegister()
 
@@ -54,6 +57,7 @@ class ToolManager:
         name, tool = self.__tool_register.register_tool(tool_function)
 
         self.tools[name] = tool
+        self._compiled_tools = None
 
         # Publish the tool registration event
         await self.message_bus.publish(
@@ -65,6 +69,31 @@ class ToolManager:
             )
         )
 
+    async def register_tool_functions(
+        self, tool_functions: List[AsyncOrSyncToolFunction]
+    ) -> None:
+        """Register several tools at once, publishing their registration
+            events as one batch.
+
+        Args:
+            tool_functions: The tools to register
+        """
+        events: List[Event] = []
+        for tool_function in tool_functions:
+            name, tool = self.__tool_register.register_tool(tool_function)
+            self.tools[name] = tool
+            events.append(
+                ToolRegisterEvent(
+                    tool_manager_id=self.tool_manager_id,
+                    session_id=self.session_id,
+                    engine_id=self.engine_id,
+                    tool_info=tool.to_dict(),
+                )
+            )
+        self._compiled_tools = None
+
+        await self.message_bus.publish_many(events)
+
     async def register_tools(self, platform_list: List[str]):
         """Register tools for a specific platform. Completely independent from register_tool.
 
@@ -75,6 +104,7 @@ class ToolManager:
         # Register tools for each platform
         for name, tool in self.__tool_register.register_tools(platform_list).items():
             self.tools[name] = tool
+            self._compiled_tools = None
 
             # Publish the tool registration event
             await self.message_bus.publish(
@@ -89,11 +119,18 @@ class ToolManager:
     async def get_tools(self) -> list[ModelFormattedDictTool]:
         """Get all registered tools from the tool register.
 
+        The tools are only compiled again after a registration, engines call this
+        on every LLM round trip.
+
         Returns:
             A list of tools in the registered model's format
         """
-        # Collect all tools from the tool register
-        tools = list(self.tools.values())
+        if self._compiled_tools is not None:
+            return self._compiled_tools
+
+        # Collect all tools from the tool register, in name order so the tool list
+        # is the same for every request whatever order the tools were registered in
+        tools = sorted(self.tools.values(), key=lambda tool: tool.name)
 
         # Publish the tool compilation event
         await self.message_bus.publish(
@@ -108,6 +145,7 @@ class ToolManager:
         ret: list[ModelFormattedDictTool] = [
             self.__tool_parser.parse_tool(tool) for tool in tools
         ]
+        self._compiled_tools = ret
 
         return ret
 
@@ -121,7 +159,8 @@ class ToolManager:
             The result of the tool execution
 
         Raises:
-            ValueError: If the tool is not found
+            ValueError: If the tool is not found or the arguments are invalid
+            Exception: Whatever the tool raised
         """
         tool_name : str = tool_call.name
 
@@ -146,6 +185,8 @@ class ToolManager:
 
         Raises:
             ValueError: If the tool is not found
+            Exception: Whatever the tool raised, after publishing the failed
+                ToolExecuteResultEvent
         """
         if tool_name not in self.tools:
             error_msg : str = f"Tool not found: {tool_name}"
@@ -187,7 +228,7 @@ class ToolManager:
                 )
             )
 
-            return f"ERROR: {e!s}"
+            raise
 
     def _get_parser(self, llm_model_name: Optional[str] = None) -> ToolParser:
         """Get the appropriate tool parser based on the LLM model name."""
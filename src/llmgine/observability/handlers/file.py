@@ -7,7 +7,7 @@ import logging
 import os
 from pathlib import Path
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from enum import Enum
 from dataclasses import asdict
 
@@ -16,6 +16,42 @@ from llmgine.observability.handlers.base import ObservabilityEventHandler
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional, several times faster than the stdlib json encoder
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_line(data: Dict[str, Any]) -> bytes:
+    """Encode a log record as one compact JSON line."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+    return (json.dumps(data, default=str, separators=(",", ":")) + "\n").encode()
+
+
+def split_log_records(content: str) -> List[str]:
+    """Split a log file's text into one JSON string per record.
+
+    Reads both the compact single-line records written by _encode_line and the
+    indented multi-line objects of older log files.
+    """
+    records: List[str] = []
+    current = ""
+    for line in content.split("\n"):
+        if not current and line.startswith("{") and line.rstrip().endswith("}"):
+            records.append(line)
+            continue
+        current += line
+        if line.strip() == "}":
+            records.append(current)
+            current = ""
+    return records
+
 
 class FileEventHandler(ObservabilityEventHandler):
     """Logs all received events to a JSONL file."""
@@ -51,12 +87,13 @@ class FileEventHandler(ObservabilityEventHandler):
             # Add event metadata
             log_data["event_type"] = type(event).__name__
 
-            # Make sure parent directory exists
-            os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+            # One compact record per line, appended, so each event costs one small
+            # write no matter how long the log already is
+            line = _encode_line(log_data)
 
             async with self._file_lock:
-                with open(self.log_file, "a") as f:
-                    f.write(json.dumps(log_data, default=str, indent=4) + "\n")
+                with open(self.log_file, "ab") as f:
+                    f.write(line)
         except Exception as e:
             logger.error(f"Error writing event data to file: {e}", exc_info=True)
 
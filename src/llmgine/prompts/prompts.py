@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -25,6 +26,14 @@ class Prompt:
         """
         return self.template.format_map(SafeFormatterDict(**kwargs))
 
+@lru_cache(maxsize=64)
+def _read_prompt_file(path: Path, mtime_ns: int) -> str:
+    """
+    Reads a prompt file once per modification time, so repeated get_prompt calls
+    for the same unchanged file share one read.
+    """
+    return path.read_text(encoding='utf-8')
+
 def get_prompt(file_path: str | Path) -> Prompt:
     """
     Reads a markdown prompt template from a file and returns a Prompt object.
@@ -44,7 +53,7 @@ def get_prompt(file_path: str | Path) -> Prompt:
         path = Path(file_path)
         if path.suffix.lower() != '.md':
             raise ValueError(f"Prompt file must be a markdown file (.md), got {path.suffix}")
-        content = path.read_text(encoding='utf-8')
+        content = _read_prompt_file(path.resolve(), path.stat().st_mtime_ns)
         return Prompt(template=content)
     except FileNotFoundError:
         print(f"Error: Prompt file not found at {file_path}")
@@ -1,9 +1,10 @@
-import asyncio
 import os
 import sys
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, Type
+from typing import Any, Callable, Iterator, Optional, Type
 
+from rich import get_console
 from rich.live import Live
 from rich.spinner import Spinner
 
@@ -26,6 +27,10 @@ from llmgine.ui.cli.components import (
     YesNoPrompt,
 )
 
+# Erase the screen and scrollback and home the cursor, written directly instead of
+# spawning a `clear` process on every redraw
+_CLEAR_SCREEN = "\033[2J\033[3J\033[H"
+
 
 @dataclass
 class StatusEvent(Event):
@@ -55,6 +60,11 @@ class EngineCLI:
         self.spinner: Optional[Spinner] = None
         self.live: Optional[Live] = None
         self.hidden: bool = False
+        self._suppress_redraw: bool = False
+        # Rendered output of self.components, in order, for the console width it
+        # was rendered at, so a redraw only renders the components added since
+        self._rendered: list[str] = []
+        self._rendered_width: int = 0
         # Bus
         self.bus: MessageBus = MessageBus()
         self.session_id: SessionID = session_id
@@ -108,12 +118,10 @@ class EngineCLI:
             "Do you want to continue?", self
         )
         result = await prompt.get_input()  # TODO what type is this
-        self.clear_screen()
-        self.redraw()
-        if prompt.component is not None:
-            component: UserComponent = prompt.component
-            component.render()
-            self.components.append(component)
+        with self.batch_redraw():
+            if prompt.component is not None:
+                component: UserComponent = prompt.component
+                self.components.append(component)
 
         return result
 
@@ -150,12 +158,9 @@ class EngineCLI:
             prompt = prompt(command)
             prompt.attach_cli(self)
             result = await prompt.get_input()
-            self.clear_screen()
-            self.redraw()
-            if prompt.component is not None:
-                component = prompt.component
-                component.render()
-                self.components.append(component)
+            with self.batch_redraw():
+                if prompt.component is not None:
+                    self.components.append(prompt.component)
             return CommandResult(success=True, result=result)
         except Exception as e:
             return CommandResult(success=False, error=str(e))
@@ -174,12 +179,48 @@ class EngineCLI:
         self.bus.register_event_handler(event, self.update_status, self.session_id)
 
     def redraw(self) -> None:
-        self.clear_screen()
-        for component in self.components:
-            component.render()
+        if self._suppress_redraw:
+            return
+        console = get_console()
+        if console.width != self._rendered_width:
+            self._rendered = []
+            self._rendered_width = console.width
+        for component in self.components[len(self._rendered) :]:
+            with console.capture() as capture:
+                component.render()
+            self._rendered.append(capture.get())
+        frame = "".join(self._rendered)
+        if os.name == "nt":
+            self.clear_screen()
+            sys.stdout.write(frame)
+        else:
+            # Clear and repaint in one write so the screen never shows up blank
+            sys.stdout.write(_CLEAR_SCREEN + frame)
+        sys.stdout.flush()
+
+    @contextmanager
+    def batch_redraw(self) -> Iterator[None]:
+        """
+        Coalesce every redraw requested inside the block into a single redraw on exit.
+        """
+        if self._suppress_redraw:
+            # Nested batch, the outermost one redraws
+            yield
+            return
+        self._suppress_redraw = True
+        try:
+            yield
+        finally:
+            self._suppress_redraw = False
+            self.redraw()
 
     def clear_screen(self) -> None:
-        os.system("cls" if os.name == "nt" else "clear")
+        if os.name == "nt":
+            # The legacy Windows console doesn't understand ANSI escapes
+            os.system("cls")
+            return
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
 
     # CLI COMMANDS STRUCTURE
 
@@ -187,13 +228,13 @@ class EngineCLI:
         self.cli_command_lookup[command] = func
 
     def process_cli_cmds(self, input: str):
-        parts = input.split(" ")
-        cmd = parts[0]
-        if cmd in self.cli_command_lookup:
-            self.cli_command_lookup[cmd]()
-            return True
-        else:
+        # Only the first word can be a command, don't split the whole message
+        cmd = input.partition(" ")[0]
+        handler = self.cli_command_lookup.get(cmd)
+        if handler is None:
             return False
+        handler()
+        return True
 
     # CLI COMMANDS
 
@@ -225,4 +266,6 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    from llmgine.bootstrap import run
+
+    run(main())
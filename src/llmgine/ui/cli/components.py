@@ -1,12 +1,12 @@
 import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING, Optional
 
 from prompt_toolkit import HTML, PromptSession
 from rich import print
 from rich.panel import Panel
-from rich.prompt import Confirm
 
 from llmgine.messages.commands import Command, CommandResult
 from llmgine.messages.events import Event
@@ -16,6 +16,30 @@ if TYPE_CHECKING:
     from llmgine.ui.cli.cli import EngineCLI
 
 
+# Prompt marker shown before user input, parsed once rather than on every prompt
+PROMPT_ARROW = HTML("  ❯ ")
+
+
+@cache
+def shared_prompt_session(purpose: str) -> PromptSession:
+    """The PromptSession shared by every prompt of one purpose, built on first use.
+
+    Building one per prompt re-creates its key bindings every turn and loses the
+    input history. Chat input ("input") and short answers ("choice") get separate
+    sessions, so y/n and number answers stay out of the chat history. The session
+    keeps the options of each prompt_async call, so callers pass every option
+    they rely on.
+    """
+    return PromptSession()
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text down to limit characters so huge results don't flood the terminal."""
+    if not isinstance(text, str) or len(text) <= limit:
+        return text
+    return f"{text[:limit]}… ({len(text) - limit} more characters)"
+
+
 class CLIComponent(ABC):
     @abstractmethod
     def render(self):
@@ -142,7 +166,7 @@ class ToolComponent(CLIComponent):
     def render(self):
         print(
             Panel(
-                self.tool_result,
+                _truncate(self.tool_result, CLIConfig().max_tool_result_chars),
                 title=f"[yellow][bold]:hammer_and_wrench: : {self.tool_name}[/bold][/yellow]",
                 title_align="left",
                 style="yellow",
@@ -190,7 +214,7 @@ class UserGeneralInput(CLIPrompt):
         return cls(UserGeneralInputCommand(prompt=prompt), cli=cli)
 
     def __init__(self, command: Command, cli: "EngineCLI"):
-        self.session: PromptSession = PromptSession()
+        self.session: PromptSession = shared_prompt_session("input")
         self.prompt = command.prompt
         self.result = None
         self.cli = cli
@@ -210,9 +234,10 @@ class UserGeneralInput(CLIPrompt):
         )
         while True:
             user_input = await self.session.prompt_async(
-                HTML("  ❯ "),
+                PROMPT_ARROW,
                 multiline=True,
                 prompt_continuation="  ❯ ",
+                vi_mode=False,
             )
             if self.cli is not None:
                 if self.cli.process_cli_cmds(user_input):
@@ -239,6 +264,7 @@ class YesNoPrompt(CLIPrompt):
     """
 
     def __init__(self, command: EngineResultCommandResult):
+        self.session: PromptSession = shared_prompt_session("choice")
         self.prompt = command.prompt
         self.result = None
 
@@ -254,9 +280,17 @@ class YesNoPrompt(CLIPrompt):
                 padding=CLIConfig().padding,
             )
         )
+        # prompt_async keeps the event loop running while waiting for the user
         while True:
-            user_input = Confirm.ask()
-            return user_input
+            user_input = await self.session.prompt_async(
+                PROMPT_ARROW, multiline=False, vi_mode=False
+            )
+            answer = user_input.strip().lower()
+            if answer in ("y", "yes"):
+                return True
+            if answer in ("n", "no"):
+                return False
+            print("[prompt.invalid]Please enter Y or N")
 
     @property
     def component(self) -> None:
@@ -279,6 +313,7 @@ class SelectPrompt(CLIPrompt):
     """
 
     def __init__(self, command: Command):
+        self.session: PromptSession = shared_prompt_session("choice")
         self.title = command.title
         self.prompt = command.prompt
 
@@ -295,8 +330,13 @@ class SelectPrompt(CLIPrompt):
             )
         )
         while True:
-            user_input = IntPrompt.ask()
-            return user_input
+            user_input = await self.session.prompt_async(
+                PROMPT_ARROW, multiline=False, vi_mode=False
+            )
+            try:
+                return int(user_input.strip())
+            except ValueError:
+                print("[prompt.invalid]Please enter a valid integer number")
 
     @property
     def component(self):
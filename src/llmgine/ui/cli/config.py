@@ -28,3 +28,6 @@ class CLIConfig(Singleton):
     padding: tuple[int, int] = (1, 2)
 
     vi_mode: bool = True
+
+    # Longer tool results are cut short when rendered, serialize keeps them whole
+    max_tool_result_chars: int = 2000
@@ -1,13 +1,16 @@
 from typing import Optional
 from dataclasses import dataclass
-from prompt_toolkit import PromptSession
 from rich.panel import Panel
 from rich import print
-from prompt_toolkit import HTML, PromptSession
 
 from llmgine.messages.commands import Command
 from llmgine.ui.cli.cli import EngineCLI
-from llmgine.ui.cli.components import CLIPrompt, CLIComponent
+from llmgine.ui.cli.components import (
+    PROMPT_ARROW,
+    CLIComponent,
+    CLIPrompt,
+    shared_prompt_session,
+)
 from llmgine.ui.cli.config import CLIConfig
 from llmgine.messages.events import Event
 @dataclass
@@ -61,7 +64,7 @@ class SpecificPrompt(CLIPrompt):
         return cls(SpecificPromptCommand(prompt=prompt, field=field), cli=cli)
 
     def __init__(self, command: SpecificPromptCommand, cli: "EngineCLI"):
-        self.session = PromptSession()
+        self.session = shared_prompt_session("input")
         self.prompt : str = command.prompt
         self.result : Optional[str] = None
         self.cli = cli
@@ -81,7 +84,7 @@ class SpecificPrompt(CLIPrompt):
         )
         while True:
             user_input = await self.session.prompt_async(
-                HTML("  ❯ "),
+                PROMPT_ARROW,
                 multiline=True,
                 prompt_continuation="  ❯ ",
                 vi_mode=CLIConfig().vi_mode,
@@ -132,10 +135,7 @@ class VoiceProcessingEngineCLI(EngineCLI):
             prompt = SpecificPrompt.from_prompt("Do you want to continue?", self, field)
 
         result = await prompt.get_input()
-        self.clear_screen()
-        self.redraw()
-        if prompt.component is not None:
-            component = prompt.component
-            component.render()
-            self.components.append(component)
+        with self.batch_redraw():
+            if prompt.component is not None:
+                self.components.append(prompt.component)
         return result
@@ -1,6 +1,5 @@
 import asyncio
 import pytest
-import pytest_asyncio
 from llmgine.bus.bus import MessageBus
 from llmgine.messages.commands import Command, CommandResult
 from dataclasses import dataclass, field
@@ -26,14 +25,6 @@ class TestEvent(Event):
     counter: int = field(default=0)
 
 
-@pytest_asyncio.fixture
-async def bus():
-    bus = MessageBus()
-    await bus.start()
-    yield bus
-    await bus.reset()
-
-
 class EventTracker:
     def __init__(self):
         self.events = []
@@ -172,6 +163,18 @@ def test_bus_register_event_handlers(bus: MessageBus):
     )
 
 
+@pytest.mark.asyncio
+async def test_bus_register_event_handler_twice(bus: MessageBus):
+    tracker = EventTracker()
+    bus.register_event_handler(TestEvent, tracker.event_function_1, "SESSION_TWICE")
+    bus.register_event_handler(TestEvent, tracker.event_function_1, "SESSION_TWICE")
+    assert len(bus._event_handlers["SESSION_TWICE"][TestEvent]) == 1
+
+    await bus.publish(TestEvent(test_data="test", session_id="SESSION_TWICE"))
+    await asyncio.sleep(0.1)
+    assert tracker.events == ["function_1 executed"]
+
+
 def test_unregister_event_handlers_success(bus: MessageBus):
     # Unregister from ROOT
     bus.register_event_handler(TestEvent, event_handler_success)
@@ -283,6 +286,70 @@ async def test_publish_event_session_global_root_inheritance_success(bus: Messag
     assert tracker.events[1] == "function_2 executed"
 
 
+@pytest.mark.asyncio
+async def test_publish_many_events_success(bus: MessageBus):
+    tracker = EventTracker()
+    bus.register_event_handler(TestEvent, tracker.track_event, "SESSION_MANY")
+    events = [
+        TestEvent(test_data=str(i), session_id="SESSION_MANY") for i in range(3)
+    ]
+    await bus.publish_many(events)
+    assert [event.test_data for event in tracker.events] == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_publish_without_awaiting_processed_promptly(bus: MessageBus):
+    tracker = EventTracker()
+    bus.register_event_handler(TestEvent, tracker.track_event, "SESSION_NO_AWAIT")
+    await bus.publish(
+        TestEvent(test_data="test", session_id="SESSION_NO_AWAIT"),
+        await_processing=False,
+    )
+    # The processing loop picks the event up without waiting out a poll interval
+    await asyncio.sleep(0.2)
+    assert [event.test_data for event in tracker.events] == ["test"]
+
+
+@pytest.mark.asyncio
+async def test_publish_many_keeps_order_with_async_handler(bus: MessageBus):
+    handled = []
+
+    async def async_handler(event: TestEvent):
+        await asyncio.sleep(0.01)
+        handled.append(event.test_data)
+
+    bus.register_event_handler(TestEvent, async_handler, "SESSION_ORDER")
+    for await_processing in (False, True):
+        handled.clear()
+        await bus.publish_many(
+            [TestEvent(test_data=str(i), session_id="SESSION_ORDER") for i in range(4)],
+            await_processing=await_processing,
+        )
+        await asyncio.sleep(0.2)
+        assert handled == ["0", "1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_handlers_start_in_registration_order(bus: MessageBus):
+    handled = []
+
+    async def async_handler(event: TestEvent):
+        handled.append("async")
+        await asyncio.sleep(0)
+
+    def sync_handler_1(event: TestEvent):
+        handled.append("sync 1")
+
+    def sync_handler_2(event: TestEvent):
+        handled.append("sync 2")
+
+    bus.register_event_handler(TestEvent, sync_handler_1, "SESSION_MIXED")
+    bus.register_event_handler(TestEvent, async_handler, "SESSION_MIXED")
+    bus.register_event_handler(TestEvent, sync_handler_2, "SESSION_MIXED")
+    await bus.publish(TestEvent(test_data="test", session_id="SESSION_MIXED"))
+    assert handled == ["sync 1", "async", "sync 2"]
+
+
 @pytest.mark.asyncio
 async def test_publish_event_session_failure_surpressed_exception(bus: MessageBus):
     tracker = EventTracker()
@@ -3,8 +3,13 @@
 # conftest.py
 
 import pytest
+import pytest_asyncio
 import os
 import dotenv
+from types import SimpleNamespace
+from typing import Optional
+
+from llmgine.bus.bus import MessageBus
 
 dotenv.load_dotenv()
 
@@ -23,3 +28,49 @@ def pytest_configure(config):
 @pytest.fixture
 def sample_fixture():
     return {"foo": "bar"}
+
+
+@pytest_asyncio.fixture
+async def bus():
+    bus = MessageBus()
+    await bus.start()
+    yield bus
+    await bus.reset()
+
+
+class FakeModel:
+    """Fake LLM that gives the same reply to every request.
+
+    With a tool name it calls that tool every time, otherwise it answers with content.
+    """
+
+    model = "fake-model"
+
+    def __init__(
+        self,
+        tool_name: Optional[str] = None,
+        arguments: str = '{"x": 1}',
+        content: str = "answer",
+    ):
+        self.tool_name = tool_name
+        self.arguments = arguments
+        self.content = content
+        self.calls = 0
+
+    async def generate(self, **kwargs):
+        self.calls += 1
+        tool_calls = None
+        if self.tool_name:
+            tool_calls = [
+                SimpleNamespace(
+                    id=f"call_{self.calls}",
+                    type="function",
+                    function=SimpleNamespace(name=self.tool_name, arguments=self.arguments),
+                )
+            ]
+        message = SimpleNamespace(
+            role="assistant",
+            content=None if tool_calls else self.content,
+            tool_calls=tool_calls,
+        )
+        return SimpleNamespace(raw=SimpleNamespace(choices=[SimpleNamespace(message=message)]))
@@ -0,0 +1,75 @@
+"""Tests for YourEngine's exact-match LLM response cache."""
+
+import pytest
+
+from llmgine.bus.bus import MessageBus
+from programs.engines.yourengine2 import YourEngine
+from tests.conftest import FakeModel
+
+
+async def ask_fresh(engine: YourEngine, prompt: str) -> str:
+    """Ask a prompt at the start of a new conversation."""
+    await engine.clear_context()
+    engine.set_system_prompt("You are a test.")
+    return await engine.execute(prompt)
+
+
+@pytest.mark.asyncio
+async def test_cache_ignores_whitespace_but_not_case(bus: MessageBus):
+    model = FakeModel()
+    engine = YourEngine(model, session_id="SESSION_CACHE")
+
+    await ask_fresh(engine, "spell cat")
+    await ask_fresh(engine, "  spell   cat ")
+    assert model.calls == 1
+
+    await ask_fresh(engine, "spell CAT")
+    assert model.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_skips_time_dependent_prompts(bus: MessageBus):
+    model = FakeModel()
+    engine = YourEngine(model, session_id="SESSION_CACHE_TIME")
+
+    await ask_fresh(engine, "what time is it now")
+    await ask_fresh(engine, "what time is it now")
+    assert model.calls == 2
+
+
+def tool_call_context(arguments: str) -> list[dict]:
+    return [
+        {"role": "user", "content": "echo it"},
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {"name": "echo", "arguments": arguments},
+                }
+            ],
+        },
+    ]
+
+
+def test_cache_keeps_whitespace_inside_tool_arguments(bus: MessageBus):
+    engine = YourEngine(FakeModel(), session_id="SESSION_CACHE_ARGS")
+
+    # Only user text is collapsed, whitespace in a tool's arguments can matter
+    assert engine._cache_key(
+        tool_call_context('{"text": "a  b"}'), []
+    ) != engine._cache_key(tool_call_context('{"text": "a b"}'), [])
+
+
+@pytest.mark.asyncio
+async def test_cache_misses_when_the_system_prompt_changes(bus: MessageBus):
+    model = FakeModel()
+    engine = YourEngine(model, session_id="SESSION_CACHE_SYSTEM")
+
+    await ask_fresh(engine, "spell cat")
+    await engine.clear_context()
+    engine.set_system_prompt("You are a different test.")
+    await engine.execute("spell cat")
+    assert model.calls == 2
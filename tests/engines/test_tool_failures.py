@@ -0,0 +1,97 @@
+"""Tests for how the engines give up on tools that keep failing."""
+
+import pytest
+
+from llmgine.bus.bus import MessageBus
+from programs.engines.tool_chat_engine import (
+    MAX_FAILED_TOOL_ROUNDS,
+    ToolChatEngine,
+    ToolChatEngineCommand,
+)
+from programs.engines.yourengine2 import (
+    MAX_TOOL_ROUNDS,
+    YourEngine,
+    YourEngineCommand,
+    YourEngineStatusEvent,
+)
+from tests.conftest import FakeModel
+
+
+def working_tool(x: int) -> int:
+    """A tool that always works.
+
+    Args:
+        x: Any number.
+    """
+    return x
+
+
+def failing_tool(x: int) -> int:
+    """A tool that always fails.
+
+    Args:
+        x: Any number.
+    """
+    raise RuntimeError("tool failed")
+
+
+@pytest.mark.asyncio
+async def test_your_engine_gives_up_when_a_tool_raises_every_round(
+    bus: MessageBus, caplog: pytest.LogCaptureFixture
+):
+    statuses = []
+    bus.register_event_handler(
+        YourEngineStatusEvent,
+        lambda event: statuses.append(event.status),
+        "SESSION_YOUR_ENGINE",
+    )
+    model = FakeModel("failing_tool")
+    engine = YourEngine(model, session_id="SESSION_YOUR_ENGINE")
+    await engine.register_tool(failing_tool)
+
+    result = await engine.handle_command(YourEngineCommand(prompt="hi"))
+
+    assert not result.success
+    assert result.error == "All tool calls failed repeatedly"
+    assert model.calls == MAX_FAILED_TOOL_ROUNDS
+    # The CLI spinner stops on "finished"
+    assert statuses[-1] == "finished"
+    # Giving up is expected, only the failing tools are logged, without a traceback
+    assert not any(record.exc_info for record in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_your_engine_stops_after_max_tool_rounds(bus: MessageBus):
+    statuses = []
+    bus.register_event_handler(
+        YourEngineStatusEvent,
+        lambda event: statuses.append(event.status),
+        "SESSION_MAX_ROUNDS",
+    )
+    model = FakeModel("working_tool")
+    engine = YourEngine(model, session_id="SESSION_MAX_ROUNDS")
+    await engine.register_tool(working_tool)
+
+    result = await engine.handle_command(YourEngineCommand(prompt="hi"))
+
+    assert not result.success
+    assert result.error == "Max tool rounds exceeded"
+    assert model.calls == MAX_TOOL_ROUNDS
+    assert statuses[-1] == "finished"
+
+
+@pytest.mark.asyncio
+async def test_tool_chat_engine_gives_up_when_a_tool_raises_every_round(
+    bus: MessageBus, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    model = FakeModel("failing_tool")
+    engine = ToolChatEngine(session_id="SESSION_TOOL_CHAT")
+    engine.llm_manager = model
+    await engine.register_tool(failing_tool)
+
+    result = await engine.handle_command(ToolChatEngineCommand(prompt="hi"))
+
+    assert not result.success
+    assert result.error == "All tool calls failed repeatedly"
+    assert model.calls == MAX_FAILED_TOOL_ROUNDS
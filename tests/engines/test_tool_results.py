@@ -0,0 +1,90 @@
+"""Tests for how the engines turn tool results into history messages."""
+
+import datetime
+
+import pytest
+
+from llmgine.bus.bus import MessageBus
+from programs.engines.tool_chat_engine import ToolChatEngine, ToolChatEngineCommand
+from programs.engines.yourengine2 import YourEngine, YourEngineCommand
+from tests.conftest import FakeModel
+
+
+def dates_tool(x: int) -> list:
+    """A tool that returns values json can't encode.
+
+    Args:
+        x: Any number.
+    """
+    return [datetime.date(2024, 1, 1)]
+
+
+def tool_results(engine) -> list[str]:
+    return [
+        message["content"]
+        for message in engine.context_manager.chat_history
+        if message["role"] == "tool"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_your_engine_stores_unencodable_values_as_strings(bus: MessageBus):
+    engine = YourEngine(FakeModel("dates_tool"), session_id="SESSION_DATES")
+    await engine.register_tool(dates_tool)
+
+    await engine.handle_command(YourEngineCommand(prompt="hi"))
+
+    assert tool_results(engine)[0] == '["2024-01-01"]'
+
+
+@pytest.mark.asyncio
+async def test_tool_chat_engine_stores_unencodable_values_as_strings(
+    bus: MessageBus, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    engine = ToolChatEngine(session_id="SESSION_DATES_TOOL_CHAT")
+    engine.llm_manager = FakeModel("dates_tool")
+    await engine.register_tool(dates_tool)
+
+    await engine.handle_command(ToolChatEngineCommand(prompt="hi"))
+
+    assert tool_results(engine)[0] == '["2024-01-01"]'
+
+
+def circular_tool(x: int) -> list:
+    """A tool that returns a list json can't encode at all.
+
+    Args:
+        x: Any number.
+    """
+    result: list = []
+    result.append(result)
+    return result
+
+
+@pytest.mark.asyncio
+async def test_tool_chat_engine_counts_an_unencodable_result_as_a_failed_tool(
+    bus: MessageBus, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    engine = ToolChatEngine(session_id="SESSION_CIRCULAR_TOOL_CHAT")
+    engine.llm_manager = FakeModel("circular_tool")
+    await engine.register_tool(circular_tool)
+
+    result = await engine.handle_command(ToolChatEngineCommand(prompt="hi"))
+
+    assert result.error == "All tool calls failed repeatedly"
+    assert tool_results(engine)[0].startswith("Error executing tool circular_tool")
+
+
+@pytest.mark.asyncio
+async def test_your_engine_counts_an_unencodable_result_as_a_failed_tool(
+    bus: MessageBus,
+):
+    engine = YourEngine(FakeModel("circular_tool"), session_id="SESSION_CIRCULAR")
+    await engine.register_tool(circular_tool)
+
+    result = await engine.handle_command(YourEngineCommand(prompt="hi"))
+
+    assert result.error == "All tool calls failed repeatedly"
+    assert tool_results(engine)[0].startswith("Error executing tool circular_tool")
@@ -0,0 +1,20 @@
+"""Tests for the Project 1 calculator tool."""
+
+import pytest
+
+from tools.project1_tools import Calculator
+
+
+@pytest.mark.asyncio
+async def test_calculator_evaluates_expression():
+    assert await Calculator().execute("2 + 3 * 4") == "Result: 14"
+    assert await Calculator().execute("2 ** -1") == "Result: 0.5"
+
+
+@pytest.mark.asyncio
+async def test_calculator_rejects_huge_powers():
+    calculator = Calculator()
+    for expression in ["9**9**9", "((9**999)**999)**999", "(2**100)**200"]:
+        result = await calculator.execute(expression)
+        assert result.startswith("Error evaluating expression: result larger than")
+    assert await calculator.execute("2**100") == f"Result: {2**100}"
@@ -6,7 +6,7 @@ import uuid
 import pytest
 
 from llmgine.llm.tools import ToolManager
-from llmgine.messages.events import ToolCall
+from llmgine.llm.tools import ToolCall
 
 class SampleEngine:
     """A sample engine for testing."""
@@ -358,3 +358,33 @@ async def test_unknown_tool():
 
     # Check exception message
     assert "Tool not found" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_register_tool_functions():
+    """Test registering several tools at once."""
+    def tool1(arg: str) -> str:
+        """First test tool.
+        
+        Args:
+            arg: The argument.
+        """
+        return arg
+
+    def tool2(x: int, y: int) -> int:
+        """Second test tool.
+        
+        Args:
+            x: The first number.
+            y: The second number.
+        """
+        return x + y
+
+    # Create tool manager and register both tools in one call
+    manager = create_tool_manager()
+    await manager.register_tool_functions([tool1, tool2])
+
+    # Both tools are registered and compiled
+    assert set(manager.tools) == {"tool1", "tool2"}
+    tools = await manager.get_tools()
+    assert [tool["function"]["name"] for tool in tools] == ["tool1", "tool2"]
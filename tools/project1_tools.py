@@ -2,14 +2,41 @@
 
 import ast
 import json
+import math
+import operator
 import os
 import re
 import random
+from functools import lru_cache
 from typing import Any, Dict, List
 from pathlib import Path
 from openai.types.chat import ChatCompletionToolParam
 
 
+# Operators the calculator evaluates, everything else in the expression is rejected
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+# Powers with a larger result take arbitrarily long to compute (e.g. 9**9**9 or
+# ((9**999)**999)**999), so they are rejected before computing them
+_MAX_POWER_BITS = 10_000
+
+
+@lru_cache(maxsize=512)
+def _parse_expression(expression: str) -> ast.expr:
+    """Parse an expression once, agents often re-evaluate the same one."""
+    return ast.parse(expression, mode="eval").body
+
+
 class Calculator:
     """Mathematical expression calculator tool."""
     
@@ -43,7 +70,7 @@ class Calculator:
             if not self._is_safe_expression(clean_expr):
                 return "Error: Expression contains unsafe operations or characters."
             
-            result = eval(clean_expr, {"__builtins__": {}}, {})
+            result = self._evaluate(_parse_expression(clean_expr))
             
             return f"Result: {result}"
             
@@ -60,6 +87,24 @@ class Calculator:
         """Check if the expression is safe to evaluate."""
         safe_pattern = r'^[\d\+\-\*\/\(\)\.\s]+$'
         return bool(re.match(safe_pattern, expression))
+    
+    def _evaluate(self, node: ast.expr) -> Any:
+        """Evaluate a parsed arithmetic expression without eval."""
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return node.value
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            return _UNARY_OPERATORS[type(node.op)](self._evaluate(node.operand))
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            left = self._evaluate(node.left)
+            right = self._evaluate(node.right)
+            if (
+                isinstance(node.op, ast.Pow)
+                and abs(left) > 1
+                and right * math.log2(abs(left)) > _MAX_POWER_BITS
+            ):
+                raise ValueError(f"result larger than {_MAX_POWER_BITS} bits")
+            return _BINARY_OPERATORS[type(node.op)](left, right)
+        raise ValueError(f"unsupported expression: {ast.dump(node)}")
 
 
 class WebSearch: